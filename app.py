@@ -3,7 +3,9 @@
 import streamlit as st
 import requests, pandas as pd, matplotlib.pyplot as plt
 from datetime import datetime, timezone
-import json
+from array import array
+from collections import Counter
+import json, os, re, mmap, difflib, heapq
 
 st.set_page_config(page_title="Local Weather (NWS)", layout="wide", initial_sidebar_state="expanded")
 
@@ -231,6 +233,116 @@ def daily_df(url):
     
     return df, properties
 
+# -------- gazetteer ---------------------------------------------------------
+# Bundled US places: one "key<TAB>label<TAB>lat<TAB>lon" row per line, sorted by
+# key, where key is a normalised "city st" name or a 5-digit ZIP. The shipped file
+# is a hand-compiled seed of capitals and major cities; scripts/build_gazetteer.py
+# regenerates it from the Census Gazetteer Places and ZCTA (ZIP) files.
+GAZETTEER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "us_places.tsv")
+
+# Leading abbreviations spelled out in the gazetteer ("St. Louis" -> "saint louis")
+PLACE_PREFIXES = {"st": "saint", "ste": "sainte", "ft": "fort", "mt": "mount"}
+
+def normalize_place(text):
+    """Lower-case, strip punctuation and expand a leading St/Ste/Ft/Mt so
+    queries line up with gazetteer keys"""
+    words = re.sub(r"[^0-9a-z]+", " ", text.lower()).split()
+    if words:
+        words[0] = PLACE_PREFIXES.get(words[0], words[0])
+    return " ".join(words)
+
+def _bigrams(text, width=8):
+    """Distinct character pairs in the first `width` characters of text"""
+    head = text[:width]
+    return {head[i:i + 2] for i in range(len(head) - 1)}
+
+@st.cache_resource(show_spinner=False)
+def load_gazetteer(path=GAZETTEER):
+    """Memory-map the gazetteer and index it in one pass: the byte offset of every
+    row, plus a map from each leading-key bigram to the rows containing it"""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    offsets, bigrams = array("I"), {}
+    pos = 0
+    for j, line in enumerate(iter(mm.readline, b"")):
+        offsets.append(pos)
+        pos += len(line)
+        for gram in _bigrams(line[:line.find(b"\t")].decode()):
+            bigrams.setdefault(gram, []).append(j)
+    return mm, offsets, {gram: array("I", rows) for gram, rows in bigrams.items()}
+
+def _gazetteer_key(mm, offset):
+    return mm[offset:mm.find(b"\t", offset)]
+
+def _gazetteer_row(mm, offset):
+    end = mm.find(b"\n", offset)
+    _, label, lat, lon = mm[offset:end if end != -1 else len(mm)].decode().split("\t")
+    return label, float(lat), float(lon)
+
+def _lower_bound(mm, offsets, needle):
+    """Index of the first row whose key is >= needle"""
+    lo, hi = 0, len(offsets)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _gazetteer_key(mm, offsets[mid]) < needle:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+# Fuzzy fallback scores at most this many candidates with difflib
+FUZZY_CANDIDATES = 64
+
+@st.cache_data(show_spinner=False, max_entries=1024)
+def search_places(query, limit=10):
+    """Find (label, lat, lon) matches by key prefix, falling back to fuzzy matching"""
+    q = normalize_place(query)
+    if not q:
+        return ()
+    mm, offsets, bigrams = load_gazetteer()
+    needle = q.encode()
+
+    hits = []
+    i = _lower_bound(mm, offsets, needle)
+    while i < len(offsets) and len(hits) < limit:
+        if not _gazetteer_key(mm, offsets[i]).startswith(needle):
+            break
+        hits.append(_gazetteer_row(mm, offsets[i]))
+        i += 1
+
+    # No prefix hit: score the keys sharing the most of the query's leading bigrams
+    # (at least half), so a typo anywhere (even the first letter) can still match.
+    # ZIPs are exact identifiers and never fall back to fuzzy matching.
+    if not hits and len(q) >= 3 and not q.isdigit():
+        grams = _bigrams(q)
+        shared = Counter()
+        for gram in grams:
+            shared.update(bigrams.get(gram, ()))
+        top = heapq.nlargest(FUZZY_CANDIDATES, shared.items(), key=lambda item: item[1])
+        scored = []
+        for j, count in top:
+            if count * 2 < len(grams):
+                break
+            key = _gazetteer_key(mm, offsets[j]).decode()
+            score = difflib.SequenceMatcher(None, q, key[:len(q)]).ratio()
+            if score >= 0.75:
+                scored.append((-score, j))
+        hits = [_gazetteer_row(mm, offsets[j]) for _, j in sorted(scored)[:limit]]
+
+    return tuple(hits)
+
+def use_place(places):
+    """Copy the chosen gazetteer match into the latitude/longitude inputs.
+
+    The selection is cleared afterwards so picking the same match again,
+    e.g. after editing the inputs by hand, applies it again.
+    """
+    idx = st.session_state.get("place")
+    if idx is not None:
+        _, lat, lon = places[idx]
+        st.session_state["lat"], st.session_state["lon"] = lat, lon
+        st.session_state["place"] = None
+
 def format_timestamp(iso_string):
     """Format ISO timestamp to readable format"""
     try:
@@ -355,9 +467,26 @@ def plot_forecast_area(geometry, lat, lon):
 # -------- sidebar -----------------------------------------------------------
 with st.sidebar:
     st.header("Your Location")
+    st.session_state.setdefault("lat", 42.3611)
+    st.session_state.setdefault("lon", -71.0570)
+
+    # Offline city lookup — fills the inputs below without any network call.
+    # The index is built once per process here, not on the first search.
+    # st.text_input (streamlit 1.41) reruns on Enter/blur, not per keystroke; a
+    # client-filtered selectbox would ship every label to the browser instead.
+    load_gazetteer()
+    query = st.text_input("Find a city", placeholder="e.g. Boston, MA")
+    places = search_places(query) if query else ()
+    if places:
+        st.selectbox("Matches", range(len(places)), index=None,
+                     format_func=lambda i: places[i][0], placeholder="Choose a match",
+                     key="place", on_change=use_place, args=(places,))
+    elif query:
+        st.caption("No matching cities")
+
     c1, c2 = st.columns(2)
-    lat = c1.number_input("Latitude",  value=42.3611, format="%.4f", step=0.0001)
-    lon = c2.number_input("Longitude", value=-71.0570, format="%.4f", step=0.0001)
+    lat = c1.number_input("Latitude",  format="%.4f", step=0.0001, key="lat")
+    lon = c2.number_input("Longitude", format="%.4f", step=0.0001, key="lon")
     go  = st.button("Get Weather")
 
     # --- current conditions ---
@@ -0,0 +1,69 @@
+# build_gazetteer.py
+# Rebuild data/us_places.tsv from the U.S. Census Bureau Gazetteer Files:
+#   https://www.census.gov/geographies/reference-files/time-series/geo/gazetteer-files.html
+# Download and unzip the national "Places" and "ZIP Code Tabulation Areas" files,
+# then run e.g.
+#   python scripts/build_gazetteer.py 2023_Gaz_place_national.txt 2023_Gaz_zcta_national.txt
+import argparse, csv, os, re
+
+OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data", "us_places.tsv")
+
+# Must stay in step with normalize_place() in app.py
+PLACE_PREFIXES = {"st": "saint", "ste": "sainte", "ft": "fort", "mt": "mount"}
+
+# Legal/statistical descriptions the Census appends to place names ("Boston city")
+PLACE_SUFFIX = re.compile(
+    r"\s+(city and borough|consolidated government|metropolitan government|"
+    r"unified government|metro government|urban county|city|town|township|village|"
+    r"borough|municipality|CDP|comunidad|zona urbana)\b.*$")
+
+def normalize_place(text):
+    words = re.sub(r"[^0-9a-z]+", " ", text.lower()).split()
+    if words:
+        words[0] = PLACE_PREFIXES.get(words[0], words[0])
+    return " ".join(words)
+
+def read_gazetteer(path):
+    """Yield the rows of a tab-delimited Census Gazetteer file (headers are space-padded)"""
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter="\t")
+        header = [h.strip() for h in next(reader)]
+        for row in reader:
+            yield dict(zip(header, (v.strip() for v in row)))
+
+def place_rows(path):
+    for r in read_gazetteer(path):
+        name = PLACE_SUFFIX.sub("", r["NAME"])
+        yield (normalize_place(f"{name} {r['USPS']}"), f"{name}, {r['USPS']}",
+               float(r["INTPTLAT"]), float(r["INTPTLONG"]), int(r["ALAND"]))
+
+def zcta_rows(path):
+    for r in read_gazetteer(path):
+        yield (r["GEOID"], f"ZIP {r['GEOID']}",
+               float(r["INTPTLAT"]), float(r["INTPTLONG"]), int(r["ALAND"]))
+
+def main():
+    ap = argparse.ArgumentParser(description="Rebuild data/us_places.tsv from Census Gazetteer files")
+    ap.add_argument("places", help="Census Gazetteer national Places file")
+    ap.add_argument("zcta", nargs="?", help="Census Gazetteer national ZCTA file")
+    ap.add_argument("-o", "--out", default=OUT)
+    args = ap.parse_args()
+
+    rows = list(place_rows(args.places))
+    if args.zcta:
+        rows += zcta_rows(args.zcta)
+
+    # Same name twice in a state (e.g. a city and a CDP): keep the larger by land area
+    best = {}
+    for key, label, lat, lon, aland in rows:
+        if key and (key not in best or aland > best[key][3]):
+            best[key] = (label, lat, lon, aland)
+
+    with open(args.out, "w", encoding="utf-8", newline="\n") as f:
+        for key in sorted(best, key=str.encode):
+            label, lat, lon, _ = best[key]
+            f.write(f"{key}\t{label}\t{lat:.4f}\t{lon:.4f}\n")
+    print(f"wrote {len(best)} rows to {os.path.normpath(args.out)}")
+
+if __name__ == "__main__":
+    main()